@@ -4,17 +4,43 @@ Automatically stores job search results in the database for future reference
 """
 
 import psycopg2
+from psycopg2 import pool
 from psycopg2.extras import Json
 from datetime import datetime
 import hashlib
 import json
 import logging
+import threading
+
+from salary_parse import parse_salary_amount, parse_salary_range_for_query
+
+# Columns returned by job listing queries
+_JOB_COLUMNS = """id, company, role, tech_stack, job_type, salary, salary_min_numeric, salary_max_numeric, salary_currency,
+                           location, description, source_platform, source_url, posted_date,
+                           scraped_date, is_active, keywords"""
+
+# Connection pools shared by every JobSearchStorage instance, keyed by database config
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 10
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+
+def get_connection_pool(db_config):
+    """Return the shared connection pool for a database config, creating it on first use"""
+    key = tuple(sorted(db_config.items()))
+    with _connection_pools_lock:
+        if key not in _connection_pools:
+            _connection_pools[key] = pool.ThreadedConnectionPool(
+                POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS, **db_config
+            )
+        return _connection_pools[key]
 
 class JobSearchStorage:
     def __init__(self, db_config):
         """Initialize database connection"""
         self.db_config = db_config
         self.connection = None
+        self._pool = None
         try:
             self.connect()
         except Exception as e:
@@ -22,9 +48,18 @@ class JobSearchStorage:
             # Don't raise here, let individual methods handle reconnection
     
     def connect(self):
-        """Establish database connection"""
+        """Borrow a database connection from the shared pool"""
         try:
-            self.connection = psycopg2.connect(**self.db_config)
+            # Give back a stale connection before borrowing a fresh one
+            self._release_connection(discard=True)
+            try:
+                self._pool = get_connection_pool(self.db_config)
+                self.connection = self._pool.getconn()
+            except pool.PoolError:
+                # Pool exhausted: fall back to a dedicated connection
+                logging.warning("⚠️ Connection pool exhausted, opening a dedicated connection")
+                self._pool = None
+                self.connection = psycopg2.connect(**self.db_config)
             self.connection.autocommit = True
             logging.info("✅ Connected to job_scraper_db successfully")
             return True
@@ -46,12 +81,13 @@ class JobSearchStorage:
             search_results (list): List of job dictionaries
         """
         stored_count = 0
-        for job in search_results:
+        parsed_salaries = self.parse_salaries_bulk(str(job.get('salary', '')) for job in search_results)
+        for job, parsed_salary in zip(search_results, parsed_salaries):
             try:
                 if not self.connection or (hasattr(self.connection, 'closed') and self.connection.closed):
                     self.connect()
                     
-                if self.store_job(job, search_query):
+                if self.store_job(job, search_query, parsed_salary):
                     stored_count += 1
             except Exception as e:
                 logging.error(f"❌ Failed to store job for company={job.get('company', 'unknown')}: {e}", exc_info=True)
@@ -59,13 +95,14 @@ class JobSearchStorage:
         logging.info(f"✅ Stored {stored_count} jobs from search query: {search_query}")
         return stored_count
     
-    def store_job(self, job_data, search_query):
+    def store_job(self, job_data, search_query, parsed_salary=None):
         """
         Store individual job with search context
         
         Args:
             job_data (dict): Job information
             search_query (dict): Original search parameters
+            parsed_salary (tuple): Pre-parsed (min, max, currency) salary, parsed here if omitted
         
         Returns:
             bool: Success status
@@ -126,7 +163,9 @@ class JobSearchStorage:
                 
                 # Parse salary to extract numeric values and currency
                 salary_text = str(job_data.get('salary', ''))
-                salary_min_numeric, salary_max_numeric, salary_currency = self.parse_salary_for_storage(salary_text)
+                if parsed_salary is None:
+                    parsed_salary = self.parse_salary_for_storage(salary_text)
+                salary_min_numeric, salary_max_numeric, salary_currency = parsed_salary
                 
                 job_record = {
                     'company': str(job_data.get('company', '')),
@@ -205,67 +244,11 @@ class JobSearchStorage:
 
     def parse_salary_range_for_query(self, salary_range):
         """Parse salary range string and return numeric min and max values"""
-        if salary_range is None or str(salary_range).strip() == "":
-            raise ValueError("Empty salary filter")
+        return parse_salary_range_for_query(salary_range)
 
-        sr = str(salary_range).strip().replace(' ', '')
-
-        try:
-            if sr.endswith('+'):
-                # Handle minimum salary filter (e.g., "100k+")
-                min_str = sr[:-1]
-                if min_str == "":
-                    raise ValueError("Missing minimum amount before '+'")
-                min_val = self.parse_salary_amount(min_str)
-                return min_val, None
-
-            elif '-' in sr:
-                # Handle range filter (e.g., "100k-200k")
-                min_str, max_str = sr.split('-', 1)
-                if min_str == "" or max_str == "":
-                    raise ValueError("Incomplete salary range")
-                min_val = self.parse_salary_amount(min_str)
-                max_val = self.parse_salary_amount(max_str)
-                return min_val, max_val
-
-            else:
-                # Handle exact match filter
-                exact_val = self.parse_salary_amount(sr)
-                return exact_val, exact_val
-
-        except (ValueError, AttributeError) as e:
-            # Re-raise ValueError as-is to preserve specific messages
-            if isinstance(e, ValueError):
-                raise
-            raise ValueError(f"Invalid salary range format: {salary_range}")
-    
     def parse_salary_amount(self, amount_str):
         """Parse a single salary amount string and return numeric value"""
-        if amount_str is None:
-            raise ValueError("Invalid salary amount: None")
-
-        # Normalize input - strip whitespace and remove plus signs
-        clean_str = str(amount_str).strip().replace('+', '')
-        if clean_str == "":
-            raise ValueError("Invalid salary amount: empty")
-
-        # Remove currency symbols and commas
-        clean_str = clean_str.replace('$', '').replace('€', '').replace('£', '').replace(',', '')
-        
-        # Handle suffix multipliers
-        lower = clean_str.lower()
-        multiplier = 1
-        if lower.endswith('k'):
-            clean_str = clean_str[:-1]
-            multiplier = 1000
-        elif lower.endswith('m'):
-            clean_str = clean_str[:-1]
-            multiplier = 1_000_000
-        
-        try:
-            return int(float(clean_str) * multiplier)
-        except (ValueError, TypeError):
-            raise ValueError(f"Invalid salary amount: {amount_str}")
+        return parse_salary_amount(amount_str)
     
     def parse_salary_for_storage(self, salary_text):
         """Parse salary text and extract numeric min, max, and currency"""
@@ -314,6 +297,16 @@ class JobSearchStorage:
         
         return None, None, currency
     
+    def parse_salaries_bulk(self, salary_texts):
+        """Parse many salary texts for storage, parsing each distinct text only once"""
+        parsed = {}
+        results = []
+        for salary_text in salary_texts:
+            if salary_text not in parsed:
+                parsed[salary_text] = self.parse_salary_for_storage(salary_text)
+            results.append(parsed[salary_text])
+        return results
+    
     def store_search_context(self, source_url, search_query):
         """Store search context for analytics"""
         try:
@@ -441,8 +434,13 @@ class JobSearchStorage:
                 "platform_stats": {}
             }
     
-    def get_jobs_filtered(self, limit=100, offset=0, search="", platform="", status="", job_type="", salary_range=""):
-        """Get jobs with filtering and pagination"""
+    def get_jobs_filtered(self, limit=100, offset=0, search="", platform="", status="", job_type="", salary_range="",
+                          salary_min=None, salary_max=None):
+        """Get jobs with filtering and pagination
+
+        Numeric salary_min/salary_max bounds take precedence over the legacy
+        salary_range string, which is only parsed when neither bound is given.
+        """
         try:
             if not self.connection or (hasattr(self.connection, 'closed') and self.connection.closed):
                 if not self.connect():
@@ -457,10 +455,8 @@ class JobSearchStorage:
                 except (ValueError, TypeError):
                     limit, offset = 100, 0
                 
-                query = """
-                    SELECT id, company, role, tech_stack, job_type, salary, salary_min_numeric, salary_max_numeric, salary_currency,
-                           location, description, source_platform, source_url, posted_date,
-                           scraped_date, is_active, keywords
+                query = f"""
+                    SELECT {_JOB_COLUMNS}
                     FROM jobs
                     WHERE 1=1
                 """
@@ -479,20 +475,23 @@ class JobSearchStorage:
                     query += " AND job_type = %s"
                     params.append(job_type)
 
-                if salary_range and salary_range.strip():
+                min_val, max_val = salary_min, salary_max
+                if min_val is None and max_val is None and salary_range and salary_range.strip():
                     try:
                         min_val, max_val = self.parse_salary_range_for_query(salary_range)
-
-                        if min_val is not None and max_val is not None:
-                            # Query against the numeric range for overlap
-                            query += " AND salary_max_numeric >= %s AND salary_min_numeric <= %s"
-                            params.extend([min_val, max_val])
-                        elif min_val is not None:
-                            # Query for minimum salary
-                            query += " AND salary_max_numeric >= %s"
-                            params.append(min_val)
                     except ValueError:
                         logging.warning("Invalid salary format")
+                if min_val is not None and max_val is not None and min_val > max_val:
+                    logging.warning(f"Salary minimum {min_val} is above maximum {max_val}; no jobs can match")
+
+                if min_val is not None:
+                    # Jobs whose range reaches the minimum
+                    query += " AND salary_max_numeric >= %s"
+                    params.append(min_val)
+                if max_val is not None:
+                    # Jobs whose range starts below the maximum
+                    query += " AND salary_min_numeric <= %s"
+                    params.append(max_val)
                 
                 if status == "active":
                     query += " AND is_active = true"
@@ -504,21 +503,7 @@ class JobSearchStorage:
                 
                 cursor.execute(query, params)
                 columns = [desc[0] for desc in cursor.description]
-                results = []
-                for row in cursor.fetchall():
-                    job = dict(zip(columns, row))
-                    # Convert arrays to lists
-                    if isinstance(job.get('tech_stack'), str):
-                        job['tech_stack'] = job['tech_stack'].strip('{}').split(',') if job['tech_stack'] else []
-                    if isinstance(job.get('keywords'), str):
-                        job['keywords'] = job['keywords'].strip('{}').split(',') if job['keywords'] else []
-                    # Convert datetime fields to string for JSON serialization
-                    if isinstance(job.get('posted_date'), datetime):
-                        job['posted_date'] = job['posted_date'].isoformat()
-                    if isinstance(job.get('scraped_date'), datetime):
-                        job['scraped_date'] = job['scraped_date'].isoformat()
-                    results.append(job)
-                return results
+                return [self._row_to_job(columns, row) for row in cursor.fetchall()]
         except psycopg2.Error as e:
             logging.error(f"❌ PostgreSQL error getting filtered jobs with params limit={limit}, offset={offset}, search='{search}', platform='{platform}', status='{status}': {e}", exc_info=True)
             return []
@@ -526,6 +511,84 @@ class JobSearchStorage:
             logging.error(f"❌ Unexpected error getting filtered jobs with params limit={limit}, offset={offset}, search='{search}', platform='{platform}', status='{status}': {e}", exc_info=True)
             return []
     
+    def get_jobs_filtered_batch(self, salary_ranges, limit=100):
+        """
+        Get jobs for several salary ranges in a single database round-trip
+        
+        Args:
+            salary_ranges (list): Salary filter strings (e.g. "$50k-$70k", "$150k+")
+            limit (int): Maximum number of jobs returned per range
+        
+        Returns:
+            dict: Jobs keyed by the input salary range string; invalid ranges map to an empty list
+        """
+        results = {salary_range: [] for salary_range in salary_ranges}
+        try:
+            if not self.connection or (hasattr(self.connection, 'closed') and self.connection.closed):
+                if not self.connect():
+                    logging.error("❌ Failed to establish database connection for retrieving jobs")
+                    return results
+            
+            try:
+                limit = max(1, min(int(limit), 1000))
+            except (ValueError, TypeError):
+                limit = 100
+            
+            # One sub-select per range, tagged with its input string so rows can be split back apart
+            subqueries = []
+            params = []
+            for salary_range in results:
+                try:
+                    min_val, max_val = self.parse_salary_range_for_query(salary_range)
+                except ValueError:
+                    logging.warning(f"Invalid salary format: {salary_range}")
+                    continue
+                
+                if max_val is not None:
+                    condition = "salary_max_numeric >= %s AND salary_min_numeric <= %s"
+                    params.extend([salary_range, min_val, max_val, limit])
+                else:
+                    condition = "salary_max_numeric >= %s"
+                    params.extend([salary_range, min_val, limit])
+                subqueries.append(f"""
+                    (SELECT %s::text AS salary_filter, {_JOB_COLUMNS}
+                     FROM jobs
+                     WHERE {condition}
+                     ORDER BY scraped_date DESC LIMIT %s)
+                """)
+            
+            if not subqueries:
+                return results
+            
+            with self.connection.cursor() as cursor:
+                cursor.execute(" UNION ALL ".join(subqueries), params)
+                columns = [desc[0] for desc in cursor.description]
+                for row in cursor.fetchall():
+                    job = self._row_to_job(columns, row)
+                    results[job.pop('salary_filter')].append(job)
+                return results
+        except psycopg2.Error as e:
+            logging.error(f"❌ PostgreSQL error getting batch filtered jobs for salary_ranges={salary_ranges}: {e}", exc_info=True)
+            return results
+        except Exception as e:
+            logging.error(f"❌ Unexpected error getting batch filtered jobs for salary_ranges={salary_ranges}: {e}", exc_info=True)
+            return results
+    
+    def _row_to_job(self, columns, row):
+        """Convert a jobs row into a JSON-friendly dictionary"""
+        job = dict(zip(columns, row))
+        # Convert arrays to lists
+        if isinstance(job.get('tech_stack'), str):
+            job['tech_stack'] = job['tech_stack'].strip('{}').split(',') if job['tech_stack'] else []
+        if isinstance(job.get('keywords'), str):
+            job['keywords'] = job['keywords'].strip('{}').split(',') if job['keywords'] else []
+        # Convert datetime fields to string for JSON serialization
+        if isinstance(job.get('posted_date'), datetime):
+            job['posted_date'] = job['posted_date'].isoformat()
+        if isinstance(job.get('scraped_date'), datetime):
+            job['scraped_date'] = job['scraped_date'].isoformat()
+        return job
+    
     def delete_job(self, job_id):
         """Delete a specific job by ID"""
         try:
@@ -550,15 +613,41 @@ class JobSearchStorage:
             logging.error(f"❌ Unexpected error deleting job with ID={job_id}: {e}", exc_info=True)
             return False
     
+    def _release_connection(self, discard=False):
+        """Return the current connection to its pool, or close it if it was not pooled"""
+        connection, self.connection = self.connection, None
+        if connection is None:
+            return
+        if self._pool is not None:
+            self._pool.putconn(connection, close=discard or bool(connection.closed))
+        else:
+            connection.close()
+    
     def close(self):
-        """Close database connection"""
+        """Release database connection back to the pool"""
         try:
             if self.connection:
-                self.connection.close()
+                self._release_connection()
                 logging.info("✅ Database connection closed")
         except Exception as e:
             logging.error(f"❌ Error closing database connection: {e}", exc_info=True)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        """Give the pool slot back if the storage was never closed"""
+        if getattr(self, "connection", None) is None:
+            return
+        try:
+            self._release_connection()
+        except Exception:
+            # The pool may already be gone during interpreter shutdown
+            pass
+
 # Database configuration
 DB_CONFIG = {
     'host': 'localhost',
@@ -9,6 +9,9 @@ from selenium_stealth import stealth
 from fake_useragent import UserAgent
 from bs4 import BeautifulSoup
 from bs4 import XMLParsedAsHTMLWarning
+import io
+import lxml.html
+from lxml import etree
 import warnings
 import time
 import requests
@@ -67,9 +70,13 @@ def scrape_indeed(driver=None, proxies=None):
     print("🕵️‍♂️ Indeed scraping is currently a placeholder.")
     return []
 
+# Class-token matches, equivalent to BeautifulSoup's class_="job" / class_="tag"
+_REMOTEOK_JOB_ROWS = etree.XPath("//tr[contains(concat(' ', normalize-space(@class), ' '), ' job ')]")
+_REMOTEOK_TAGS = etree.XPath(".//div[contains(concat(' ', normalize-space(@class), ' '), ' tag ')]")
+
 def scrape_remoteok():
     """
-    Scrapes the top 5 job listings from Remote OK using requests and BeautifulSoup.
+    Scrapes the top 5 job listings from Remote OK using requests and lxml.
 
     Note:
     - This scraper is subject to rate limiting and may not work if you have made too many requests recently.
@@ -100,13 +107,17 @@ def scrape_remoteok():
                 time.sleep(10 * (2 ** attempt))  # True exponential backoff
                 continue
             res.raise_for_status()
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_list = soup.find_all("tr", class_="job")[:5]  # Limit to top 5
+            if not res.text.strip():
+                # lxml refuses an empty document; there is nothing to scrape
+                print("❌ Remote OK returned an empty page, skipping.")
+                break
+            tree = lxml.html.fromstring(res.text)
+            job_list = _REMOTEOK_JOB_ROWS(tree)[:5]  # Limit to top 5
             for job in job_list:
                 title = job.get("data-position")
                 company = job.get("data-company")
                 link = "https://remoteok.com" + job.get("data-href", "")
-                tags = [t.text for t in job.find_all("div", class_="tag")]
+                tags = [t.text_content() for t in _REMOTEOK_TAGS(job)]
                 jobs.append({
                     "Company": company,
                     "Role": title,
@@ -139,7 +150,7 @@ def scrape_job_together():
             print("Job Together URL returned 404 Not Found. Skipping scraping Job Together.")
             return jobs
         res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
+        soup = BeautifulSoup(res.text, "lxml")
         job_cards = soup.find_all("div", class_="job-card")[:5]
         for job in job_cards:
             title_elem = job.find("h2", class_="job-title")
@@ -178,7 +189,7 @@ def scrape_no_desk():
     try:
         res = requests.get(url, headers=headers, timeout=10)
         res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
+        soup = BeautifulSoup(res.text, "lxml")
         job_cards = soup.find_all("div", class_="job")[:5]
         for job in job_cards:
             title_elem = job.find("h3", class_="job-title")
@@ -205,6 +216,13 @@ def scrape_no_desk():
         print(f"Error scraping No Desk: {e}")
     return jobs
 
+def _first_with_class(element, tag, class_name):
+    """Return the first descendant <tag> carrying class_name, or None."""
+    for child in element.iter(tag):
+        if class_name in child.get("class", "").split():
+            return child
+    return None
+
 def scrape_arc_dev(driver=None):
     """
     Scrapes the top 5 job listings from Arc.dev using Selenium.
@@ -218,18 +236,24 @@ def scrape_arc_dev(driver=None):
         driver.get(url)
         wait = WebDriverWait(driver, 30)
         wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a.job-card")))
-        soup = BeautifulSoup(driver.page_source, "lxml")
-        job_cards = soup.find_all("a", class_="job-card")[:5]
-        for job in job_cards:
-            title_elem = job.find("h3", class_="job-title")
-            company_elem = job.find("div", class_="company-name")
-            location_elem = job.find("div", class_="job-location")
-            link_elem = job
+        # Stream the page and stop after the top 5 cards instead of building the whole tree
+        stream = io.BytesIO(driver.page_source.encode("utf-8"))
+        for _, job in etree.iterparse(stream, events=("end",), tag="a", html=True, encoding="utf-8"):
+            if "job-card" not in job.get("class", "").split():
+                continue
+            title_elem = _first_with_class(job, "h3", "job-title")
+            company_elem = _first_with_class(job, "div", "company-name")
+            location_elem = _first_with_class(job, "div", "job-location")
 
-            title = title_elem.text.strip() if title_elem else "N/A"
-            company = company_elem.text.strip() if company_elem else "N/A"
-            location = location_elem.text.strip() if location_elem else "N/A"
-            link = link_elem['href'] if link_elem else "N/A"
+            title = "".join(title_elem.itertext()).strip() if title_elem is not None else "N/A"
+            company = "".join(company_elem.itertext()).strip() if company_elem is not None else "N/A"
+            location = "".join(location_elem.itertext()).strip() if location_elem is not None else "N/A"
+            link = job.get("href", "N/A")
+
+            # Drop the processed card and any earlier siblings to keep memory flat
+            job.clear()
+            while job.getprevious() is not None:
+                del job.getparent()[0]
 
             jobs.append({
                 "Company": company,
@@ -241,6 +265,8 @@ def scrape_arc_dev(driver=None):
                 "Email": "N/A",
                 "Link": link
             })
+            if len(jobs) == 5:
+                break
     except Exception as e:
         print(f"Error scraping Arc.dev: {e}")
     return jobs
@@ -1,6 +1,7 @@
 import asyncio
 from typing import List, Dict, Optional, Union
 from playwright.async_api import async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup, Tag
 from bs4.element import NavigableString
 from fake_useragent import UserAgent
@@ -43,7 +44,7 @@ async def scrape_remoteok(context, keywords: str = "python", max_retries: int =
         try:
             logger.info(f"Attempt {attempt + 1}/{max_retries}: Scraping RemoteOK with keywords: {keywords}")
             content = await get_page_content(url, context, timeout=60000)
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, "lxml")
             jobs: List[dict] = []
             job_list = soup.find_all("tr", class_="job")[:5]
             
@@ -209,7 +210,7 @@ async def scrape_nodesk(context, keywords: str = "python") -> List[dict]:
         content = await page.content()
         await page.close()
         
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, "lxml")
         jobs_list: List[dict] = []
         
         # Try multiple selectors for job items
@@ -373,13 +374,16 @@ async def scrape_arkdev(context, keywords: str = "python") -> List[dict]:
     try:
         # Use Playwright to get the page content (better for dynamic content)
         page = await context.new_page()
-        await page.goto(url)
-        # Wait for page to load
-        await page.wait_for_timeout(5000)
+        await page.goto(url, wait_until="domcontentloaded")
+        # Wait for the network to settle instead of sleeping a fixed amount
+        try:
+            await page.wait_for_load_state("networkidle", timeout=10000)
+        except PlaywrightTimeoutError:
+            logger.warning("ark.dev did not reach network idle within 10s, continuing")
         content = await page.content()
         await page.close()
         
-        soup = BeautifulSoup(content, "html.parser")
+        soup = BeautifulSoup(content, "lxml")
         jobs: List[dict] = []
         
         # Check if we're on the error page
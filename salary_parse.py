@@ -0,0 +1,85 @@
+"""
+Salary parsing helpers shared by the job storage layer and its tests.
+Filters repeat across queries, so parsed ranges are memoized.
+"""
+
+import functools
+import re
+
+# Splits a salary filter into "<min>+", "<min>-<max>" (first dash) or an exact amount
+_SALARY_RANGE_RE = re.compile(r'^(?:(?P<plus_min>.*)\+|(?P<min>[^-]*)-(?P<max>.*)|(?P<exact>.*))$', re.DOTALL)
+
+# Multipliers for the amount suffixes accepted by parse_salary_amount
+_SALARY_SUFFIXES = {'k': 1000, 'm': 1_000_000}
+
+def parse_salary_amount(amount_str):
+    """Parse a single salary amount string and return numeric value"""
+    if amount_str is None:
+        raise ValueError("Invalid salary amount: None")
+
+    # Normalize input - strip whitespace and remove plus signs
+    clean_str = str(amount_str).strip().replace('+', '')
+    if clean_str == "":
+        raise ValueError("Invalid salary amount: empty")
+
+    # Remove currency symbols and commas. Chained replace() beats a
+    # deletion table with str.translate(), which takes CPython's slow path.
+    clean_str = clean_str.replace('$', '').replace('€', '').replace('£', '').replace(',', '')
+    if clean_str == "":
+        raise ValueError(f"Invalid salary amount: {amount_str}")
+
+    # Handle suffix multipliers
+    multiplier = _SALARY_SUFFIXES.get(clean_str[-1].lower())
+    if multiplier:
+        clean_str = clean_str[:-1]
+    else:
+        multiplier = 1
+
+    # Whole amounts skip the float round trip; anything else int() rejects
+    # (exponents, inf/nan) still goes through float() as before
+    if '.' not in clean_str:
+        try:
+            return int(clean_str) * multiplier
+        except ValueError:
+            pass
+
+    try:
+        return int(float(clean_str) * multiplier)
+    except (ValueError, TypeError):
+        raise ValueError(f"Invalid salary amount: {amount_str}")
+
+@functools.lru_cache(maxsize=256)
+def _parse_salary_range(sr):
+    """Parse a normalized (stripped, space-free) salary filter; filters repeat, so results are cached"""
+    match = _SALARY_RANGE_RE.match(sr)
+    if match.group('plus_min') is not None:
+        # Handle minimum salary filter (e.g., "100k+")
+        min_str = match.group('plus_min')
+        if min_str == "":
+            raise ValueError("Missing minimum amount before '+'")
+        return parse_salary_amount(min_str), None
+
+    elif match.group('max') is not None:
+        # Handle range filter (e.g., "100k-200k")
+        min_str, max_str = match.group('min'), match.group('max')
+        if min_str == "" or max_str == "":
+            raise ValueError("Incomplete salary range")
+        return parse_salary_amount(min_str), parse_salary_amount(max_str)
+
+    else:
+        # Handle exact match filter
+        exact_val = parse_salary_amount(match.group('exact'))
+        return exact_val, exact_val
+
+def parse_salary_range_for_query(salary_range):
+    """Parse salary range string and return numeric min and max values"""
+    if salary_range is None:
+        raise ValueError("Empty salary filter")
+    sr = str(salary_range).strip()
+    if not sr:
+        raise ValueError("Empty salary filter")
+
+    try:
+        return _parse_salary_range(sr.replace(' ', ''))
+    except AttributeError:
+        raise ValueError(f"Invalid salary range format: {salary_range}")
@@ -15,8 +15,9 @@ SECRET_KEY: str = str(_secret_key)  # Type annotation ensures it's treated as st
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (minimum bcrypt cost under the test suite only)
+BCRYPT_ROUNDS = 4 if os.getenv("TESTING") == "1" else 12
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
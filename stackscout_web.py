@@ -12,9 +12,14 @@ from fastapi import FastAPI, Request, Depends
 from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 import logging
 import json
-from pydantic import BaseModel, Field
+import orjson
+from html import escape
+from markupsafe import Markup
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional
   
 from enhanced_scraper import EnhancedJobScraper
 from job_search_storage import JobSearchStorage, DB_CONFIG
@@ -30,7 +35,6 @@ from src.models.user_profile import (
 )
 
 # Import authentication
-from src.auth.endpoints import router as auth_router
 from src.auth.dependencies import get_current_user, get_optional_current_user
 
 # Import recommendations
@@ -42,16 +46,41 @@ from src.analytics.engine import get_all_analytics
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson instead of the stdlib json module"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+app = FastAPI(default_response_class=ORJSONResponse)
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
 
-# Include authentication router
-app.include_router(auth_router)
+# Compiled template bytecode is cached on disk so restarts skip recompiling from source
+JINJA_CACHE_DIR = ".jinja_cache"
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+jinja_env = Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=select_autoescape(),
+    bytecode_cache=FileSystemBytecodeCache(JINJA_CACHE_DIR),
+    auto_reload=False,
+)
+templates = Jinja2Templates(env=jinja_env)
+
+# Pre-warm the most frequently rendered templates at import time
+for _template_name in ("enhanced_index.html", "results.html"):
+    jinja_env.get_template(_template_name)
+
+# Include authentication router (can be skipped for selective test runs)
+if not os.getenv("STACKSCOUT_DISABLE_AUTH"):
+    from src.auth.endpoints import router as auth_router
+    app.include_router(auth_router)
 
 # Include recommendations router
 app.include_router(recommendations_router)
 
+def escape_results_for_template(results):
+    """Escape every job field once so the results template can render them without per-cell escaping"""
+    return [{key: Markup(escape(str(value))) for key, value in job.items()} for job in results]
+
 @app.get("/", response_class=HTMLResponse)
 def read_form(request: Request):
     return templates.TemplateResponse("enhanced_index.html", {"request": request})
@@ -70,26 +99,33 @@ async def run_job_search(request: Request):
         results = await scraper.scrape_all_platforms(keywords)
 
         # Store results in database
-        storage = JobSearchStorage(DB_CONFIG)
         search_query = {
             "keywords": keywords,
             "location": location,
             "job_type": job_type
         }
-        storage.store_search_results(search_query, results)
-        storage.close()
+        with JobSearchStorage(DB_CONFIG) as storage:
+            storage.store_search_results(search_query, results)
 
     except Exception as e:
         logger.error(f"Job search failed: {e}")
         return templates.TemplateResponse("results.html", {"request": request, "results": [], "error": "Job search failed. Please try again later."})
 
-    return templates.TemplateResponse("results.html", {"request": request, "results": results})
+    return templates.TemplateResponse("results.html", {"request": request, "results": escape_results_for_template(results)})
 
 class SearchRequest(BaseModel):
     keywords: str
     location: str = ""
     job_type: str = Field(default="", description="Type of job (e.g., full-time, part-time)")
-    salary_range: str = Field(default="", description="Salary range (e.g., $50k-$70k)")
+    salary_range: str = Field(default="", description="Legacy salary range string (e.g., $50k-$70k)")
+    salary_min: Optional[int] = Field(default=None, ge=0, description="Minimum annual salary")
+    salary_max: Optional[int] = Field(default=None, ge=0, description="Maximum annual salary")
+
+    @model_validator(mode="after")
+    def check_salary_bounds(self):
+        if self.salary_min is not None and self.salary_max is not None and self.salary_min > self.salary_max:
+            raise ValueError("salary_min must not be greater than salary_max")
+        return self
 
 def serialize_for_json(obj):
     """Convert non-JSON serializable objects to JSON serializable format"""
@@ -119,6 +155,8 @@ async def api_search(request: SearchRequest):
             search=request.keywords,
             job_type=request.job_type,
             salary_range=request.salary_range,
+            salary_min=request.salary_min,
+            salary_max=request.salary_max,
         )
         
         # If we have filtered results, return them
@@ -126,7 +164,8 @@ async def api_search(request: SearchRequest):
             return JSONResponse(content={"results": filtered_jobs})
         
         # If no filtered results but we have specific filters, don't scrape
-        if request.job_type or request.salary_range:
+        has_salary_filter = request.salary_range or request.salary_min is not None or request.salary_max is not None
+        if request.job_type or has_salary_filter:
             return JSONResponse(content={"results": []})
         
         # If no filters specified, scrape new jobs
@@ -142,6 +181,8 @@ async def api_search(request: SearchRequest):
             "location": request.location,
             "job_type": request.job_type,
             "salary_range": request.salary_range,
+            "salary_min": request.salary_min,
+            "salary_max": request.salary_max,
         }
         storage.store_search_results(search_query, serialized_results)
         
@@ -166,9 +207,8 @@ async def api_save_job(request: Request):
         # Convert datetime and dict fields to JSON serializable format
         serialized_job = serialize_for_json(job_data)
         
-        storage = JobSearchStorage(DB_CONFIG)
-        success = storage.store_job(serialized_job, {})
-        storage.close()
+        with JobSearchStorage(DB_CONFIG) as storage:
+            success = storage.store_job(serialized_job, {})
         
         return JSONResponse(content={"success": success})
     except Exception as e:
@@ -204,9 +244,8 @@ def database_manager(request: Request):
 async def get_database_stats():
     """Get database statistics for the manager dashboard"""
     try:
-        storage = JobSearchStorage(DB_CONFIG)
-        stats = storage.get_database_stats()
-        storage.close()
+        with JobSearchStorage(DB_CONFIG) as storage:
+            stats = storage.get_database_stats()
         return JSONResponse(content=stats)
     except Exception as e:
         logger.error(f"Database stats failed: {e}")
@@ -224,17 +263,16 @@ async def get_jobs(
 ):
     """Get jobs with filtering and pagination"""
     try:
-        storage = JobSearchStorage(DB_CONFIG)
-        jobs = storage.get_jobs_filtered(
-            limit=limit,
-            offset=offset,
-            search=search,
-            platform=platform,
-            status=status,
-            job_type=job_type,
-            salary_range=salary_range
-        )
-        storage.close()
+        with JobSearchStorage(DB_CONFIG) as storage:
+            jobs = storage.get_jobs_filtered(
+                limit=limit,
+                offset=offset,
+                search=search,
+                platform=platform,
+                status=status,
+                job_type=job_type,
+                salary_range=salary_range
+            )
         return JSONResponse(content={"jobs": jobs})
     except Exception as e:
         logger.error(f"Get jobs failed: {e}")
@@ -244,9 +282,8 @@ async def get_jobs(
 async def delete_job(job_id: int):
     """Delete a specific job"""
     try:
-        storage = JobSearchStorage(DB_CONFIG)
-        success = storage.delete_job(job_id)
-        storage.close()
+        with JobSearchStorage(DB_CONFIG) as storage:
+            success = storage.delete_job(job_id)
         return JSONResponse(content={"success": success})
     except Exception as e:
         logger.error(f"Delete job failed: {e}")
@@ -417,21 +454,28 @@ async def get_ai_tools():
         "status": "active"
     })
 
+def get_analytics_loader():
+    """Dependency returning the callable that assembles analytics data."""
+    return get_all_analytics
+
 @app.get("/api/analytics")
-async def get_analytics(current_user: dict = Depends(get_current_user)):
+async def get_analytics(
+    current_user: dict = Depends(get_current_user),
+    load_analytics = Depends(get_analytics_loader)
+):
     """Get all analytics data for the dashboard."""
     try:
-        analytics_data = get_all_analytics()
+        analytics_data = load_analytics()
         logger.info(
             "Analytics retrieved: jobs_total=%s users_total=%s",
             analytics_data.get("overall", {}).get("jobs", {}).get("total", 0),
             analytics_data.get("overall", {}).get("users", {}).get("total", 0)
         )
         serialized_data = serialize_for_json(analytics_data)
-        return JSONResponse(content=serialized_data)
+        return ORJSONResponse(content=serialized_data)
     except Exception as e:
         logger.error(f"Analytics data retrieval failed: {e}")
-        return JSONResponse(content={"error": str(e)}, status_code=500)
+        return ORJSONResponse(content={"error": str(e)}, status_code=500)
 
 @app.get("/analytics", response_class=HTMLResponse)
 def analytics_dashboard(request: Request, current_user: dict = Depends(get_current_user)):
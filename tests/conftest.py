@@ -0,0 +1,212 @@
+"""Shared pytest fixtures for the StackScout test suite."""
+
+import os
+import sys
+import uuid
+import warnings
+import httpx
+import psycopg2
+from psycopg2 import sql
+import pytest
+import pytest_asyncio
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from playwright.async_api import async_playwright
+
+# Make the repository root importable for every test module
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Use the cheap password hashing configuration before the app is imported
+os.environ["TESTING"] = "1"
+
+# RemoteOK listing table shared by the requests and Playwright scraper tests
+REMOTEOK_TABLE_HTML = """
+<table>
+    <tr class="job" data-position="Dev" data-company="CompanyA" data-href="/job1">
+        <div class="tag">Python</div>
+        <div class="tag">Django</div>
+    </tr>
+    <tr class="job" data-position="Engineer" data-company="CompanyB" data-href="/job2">
+        <div class="tag">JavaScript</div>
+        <div class="tag">React</div>
+    </tr>
+</table>
+"""
+
+
+def pytest_configure(config):
+    """Skip wiring up the auth router when the -m selection excludes auth tests."""
+    markexpr = config.getoption("-m")
+    if not markexpr:
+        return
+    words = markexpr.split()
+    # Only recognise selections that plainly leave out the auth tests; anything else keeps the router
+    excludes_auth = words == ["not", "auth"] or (
+        "(" not in markexpr and "auth" not in words and "not" not in words
+    )
+    if excludes_auth:
+        os.environ.setdefault("STACKSCOUT_DISABLE_AUTH", "1")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests that reach live sites unless STACKSCOUT_NETWORK_TESTS is set."""
+    if os.environ.get("STACKSCOUT_NETWORK_TESTS"):
+        return
+    skip_network = pytest.mark.skip(reason="set STACKSCOUT_NETWORK_TESTS=1 to run tests against live sites")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_database():
+    """Give each pytest-xdist worker its own copy of the seeded database."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        yield
+        return
+
+    from job_search_storage import DB_CONFIG
+    template_db = DB_CONFIG["database"]
+    worker_db = f"{template_db}_{worker}"
+    try:
+        admin = psycopg2.connect(**{**DB_CONFIG, "database": "postgres"})
+    except psycopg2.Error:
+        # No database server; DB-backed tests skip themselves via require_database
+        yield
+        return
+    admin.autocommit = True
+
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(worker_db)))
+            cursor.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                sql.Identifier(worker_db), sql.Identifier(template_db)
+            ))
+    except psycopg2.Error as e:
+        # Template in use or no CREATEDB privilege; share the seeded database instead
+        admin.close()
+        warnings.warn(f"Could not create {worker_db}, using {template_db}: {e}")
+        yield
+        return
+    DB_CONFIG["database"] = worker_db
+    try:
+        yield
+    finally:
+        DB_CONFIG["database"] = template_db
+        with admin.cursor() as cursor:
+            cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(worker_db)))
+        admin.close()
+
+
+@pytest.fixture(scope="session")
+def remoteok_table_html():
+    """RemoteOK listing markup with two job rows."""
+    return REMOTEOK_TABLE_HTML
+
+
+@pytest.fixture
+def mock_selenium_driver():
+    """Plain Selenium driver stand-in whose navigation calls are no-ops; tests set page_source."""
+    return SimpleNamespace(
+        get=lambda url: None,
+        refresh=lambda: None,
+        quit=lambda: None,
+        page_source="",
+    )
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Build the FastAPI app and its TestClient once for the whole session."""
+    from stackscout_web import app
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Async client over the ASGI app so independent requests can be awaited concurrently."""
+    from stackscout_web import app
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def require_database():
+    """Skip tests that need PostgreSQL when the configured database is unreachable."""
+    from job_search_storage import DB_CONFIG
+    try:
+        psycopg2.connect(**DB_CONFIG).close()
+    except psycopg2.Error as e:
+        pytest.skip(f"Database is not available: {e}")
+
+
+@pytest.fixture(scope="session")
+def storage():
+    """Share one JobSearchStorage, and its pooled connection, across the whole session."""
+    from job_search_storage import JobSearchStorage, DB_CONFIG
+    storage = JobSearchStorage(DB_CONFIG)
+    yield storage
+    storage.close()
+
+
+TEST_PASSWORD = "testpassword123"
+
+
+def seed_test_user(prefix="testuser"):
+    """Insert a fresh user straight into the database and mint its token, skipping /auth/register and /auth/login."""
+    from job_search_storage import DB_CONFIG
+    from src.auth.database import AuthDatabase
+    from src.auth.security import create_access_token, get_password_hash
+
+    username = f"{prefix}_{uuid.uuid4().hex[:8]}"
+    db = AuthDatabase(DB_CONFIG)
+    db.connect()
+    try:
+        user_id = db.create_user(
+            username=username,
+            email=f"{username}@example.com",
+            password_hash=get_password_hash(TEST_PASSWORD),
+            full_name="Test User"
+        )
+    finally:
+        db.close()
+    if user_id is None:
+        pytest.fail(f"Could not seed test user {username}")
+
+    token = create_access_token({"sub": username, "user_id": user_id})
+    return {
+        "id": user_id,
+        "username": username,
+        "password": TEST_PASSWORD,
+        "token": token,
+        "headers": {"Authorization": f"Bearer {token}"}
+    }
+
+
+@pytest.fixture(scope="session")
+def auth_user(require_database):
+    """Seed one user for the whole session, paying the password hash cost once."""
+    return seed_test_user()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser():
+    """Launch a single headless Chromium instance for the whole test session."""
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium is not available: {e}")
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def context(browser):
+    """Provide a fresh, isolated browser context for each test."""
+    context = await browser.new_context()
+    yield context
+    await context.close()
@@ -1,20 +1,21 @@
 """Tests for the analytics API endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock
-import sys
-import os
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from stackscout_web import get_analytics_loader
+from src.auth.dependencies import get_current_user
 
-from stackscout_web import app
-from src.analytics.engine import get_all_analytics
+pytestmark = pytest.mark.analytics
 
-client = TestClient(app)
+@pytest.fixture
+def dependency_overrides(client):
+    """Authenticate requests as a test user and restore the app's dependencies afterwards."""
+    overrides = client.app.dependency_overrides
+    overrides[get_current_user] = lambda: {"id": 1, "username": "testuser", "is_active": True}
+    yield overrides
+    overrides.clear()
 
-def test_analytics_endpoint_success():
+def test_analytics_endpoint_success(client, dependency_overrides):
     """Test successful retrieval of analytics data."""
     # Mock the get_all_analytics function to return sample data
     sample_data = {
@@ -51,25 +52,27 @@ def test_analytics_endpoint_success():
         }
     }
     
-    with patch('src.analytics.engine.get_all_analytics', return_value=sample_data):
-        response = client.get("/api/analytics")
-        assert response.status_code == 200
-        data = response.json()
-        assert "overall" in data
-        assert "user_interactions" in data
-        assert "search_patterns" in data
-        assert "recommendations" in data
+    dependency_overrides[get_analytics_loader] = lambda: (lambda: sample_data)
+    response = client.get("/api/analytics")
+    assert response.status_code == 200
+    data = response.json()
+    assert "overall" in data
+    assert "user_interactions" in data
+    assert "search_patterns" in data
+    assert "recommendations" in data
 
-def test_analytics_endpoint_failure():
+def test_analytics_endpoint_failure(client, dependency_overrides):
     """Test handling of analytics data retrieval failure."""
-    # Mock the get_all_analytics function to raise an exception
-    with patch('src.analytics.engine.get_all_analytics', side_effect=Exception("Database error")):
-        response = client.get("/api/analytics")
-        assert response.status_code == 500
-        data = response.json()
-        assert "error" in data
+    # Swap in an analytics loader that raises
+    def failing_loader():
+        raise Exception("Database error")
+    dependency_overrides[get_analytics_loader] = lambda: failing_loader
+    response = client.get("/api/analytics")
+    assert response.status_code == 500
+    data = response.json()
+    assert "error" in data
 
-def test_analytics_dashboard_page():
+def test_analytics_dashboard_page(client):
     """Test that the analytics dashboard page loads."""
     response = client.get("/analytics")
     # This will fail because we don't have authentication in the test client
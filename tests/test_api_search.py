@@ -1,10 +1,19 @@
 import pytest
-from fastapi.testclient import TestClient
-from stackscout_web import app
 
-client = TestClient(app)
+pytestmark = pytest.mark.search
 
-def test_api_search_valid_request():
+def test_api_search_valid_request(client):
+    response = client.post("/api/search", json={
+        "keywords": "python",
+        "location": "remote",
+        "job_type": "full-time",
+        "salary_min": 50000,
+        "salary_max": 70000
+    })
+    assert response.status_code == 200
+    assert "results" in response.json()
+
+def test_api_search_legacy_salary_range(client):
     response = client.post("/api/search", json={
         "keywords": "python",
         "location": "remote",
@@ -14,7 +23,16 @@ def test_api_search_valid_request():
     assert response.status_code == 200
     assert "results" in response.json()
 
-def test_api_search_missing_keywords():
+@pytest.mark.parametrize("bounds", [
+    {"salary_min": -1},
+    {"salary_max": -1},
+    {"salary_min": 90000, "salary_max": 50000},
+])
+def test_api_search_invalid_salary_bounds(client, bounds):
+    response = client.post("/api/search", json={"keywords": "python", **bounds})
+    assert response.status_code == 422  # Unprocessable Entity
+
+def test_api_search_missing_keywords(client):
     response = client.post("/api/search", json={
         "location": "remote",
         "job_type": "full-time",
@@ -22,11 +40,11 @@ def test_api_search_missing_keywords():
     })
     assert response.status_code == 422  # Unprocessable Entity
 
-def test_api_search_empty_request():
+def test_api_search_empty_request(client):
     response = client.post("/api/search", json={})
     assert response.status_code == 422  # Unprocessable Entity
 
-def test_api_search_invalid_job_type():
+def test_api_search_invalid_job_type(client):
     response = client.post("/api/search", json={
         "keywords": "python",
         "location": "remote",
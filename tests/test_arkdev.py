@@ -1,53 +1,55 @@
-import asyncio
-from playwright.async_api import async_playwright
+import pytest
 import logging
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def test_arkdev():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=False, timeout=10000)
-        context = await browser.new_context()
-        page = await context.new_page()
+@pytest.mark.network
+@pytest.mark.asyncio(loop_scope="session")
+async def test_arkdev(context, tmp_path):
+    page = await context.new_page()
+    
+    logger.info("Navigating to ark.dev...")
+    await page.goto("https://ark.dev", timeout=10000, wait_until="domcontentloaded")
+    
+    # Wait for the network to settle instead of sleeping a fixed amount
+    try:
+        await page.wait_for_load_state("networkidle", timeout=10000)
+    except PlaywrightTimeoutError:
+        logger.warning("ark.dev did not reach network idle within 10s, continuing")
+    
+    # Take a screenshot
+    screenshot_path = tmp_path / "arkdev_actual.png"
+    await page.screenshot(path=screenshot_path, full_page=True)
+    logger.info(f"Screenshot saved as {screenshot_path}")
+    
+    # Get page content
+    content = await page.content()
+    
+    # Save HTML content
+    html_path = tmp_path / "arkdev_actual.html"
+    html_path.write_text(content, encoding="utf-8")
+    logger.info(f"HTML content saved as {html_path}")
+    
+    # Try to find job elements
+    try:
+        await page.wait_for_selector("div.job-card, div.job-listing, article", timeout=10000)
+        logger.info("Found job elements with selectors: div.job-card, div.job-listing, article")
+    except Exception as e:
+        logger.error(f"Timeout waiting for job elements: {e}")
         
-        logger.info("Navigating to ark.dev...")
-        await page.goto("https://ark.dev", timeout=10000)
+        # Try to find any elements that might be job-related
+        elements = await page.query_selector_all("div, article, section")
+        logger.info(f"Found {len(elements)} div/article/section elements")
         
-        # Wait for page to load
-        await page.wait_for_timeout(5000)
-        
-        # Take a screenshot
-        await page.screenshot(path="arkdev_actual.png", full_page=True)
-        logger.info("Screenshot saved as arkdev_actual.png")
-        
-        # Get page content
-        content = await page.content()
-        
-        # Save HTML content
-        with open("arkdev_actual.html", "w", encoding="utf-8") as f:
-            f.write(content)
-        logger.info("HTML content saved as arkdev_actual.html")
-        
-        # Try to find job elements
-        try:
-            await page.wait_for_selector("div.job-card, div.job-listing, article", timeout=10000)
-            logger.info("Found job elements with selectors: div.job-card, div.job-listing, article")
-        except Exception as e:
-            logger.error(f"Timeout waiting for job elements: {e}")
-            
-            # Try to find any elements that might be job-related
-            elements = await page.query_selector_all("div, article, section")
-            logger.info(f"Found {len(elements)} div/article/section elements")
-            
-            # Check first few elements
-            for i, elem in enumerate(elements[:10]):
-                tag_name = await elem.evaluate("el => el.tagName")
-                class_name = await elem.evaluate("el => el.className") or ""
-                logger.info(f"Element {i}: {tag_name} with class: {class_name}")
-        
-        await page.close()
-        await browser.close()
+        # Check first few elements
+        for i, elem in enumerate(elements[:10]):
+            tag_name = await elem.evaluate("el => el.tagName")
+            class_name = await elem.evaluate("el => el.className") or ""
+            logger.info(f"Element {i}: {tag_name} with class: {class_name}")
+    
+    await page.close()
 
 if __name__ == "__main__":
-    asyncio.run(test_arkdev())
+    pytest.main([__file__, "-v"])
@@ -1,79 +1,49 @@
-#!/usr/bin/env python3
-"""Test script for authentication system."""
+"""Tests for the authentication endpoints."""
 
-import requests
-import json
+import asyncio
+import uuid
+import pytest
 
-BASE_URL = "http://localhost:8000"
+pytestmark = [pytest.mark.auth, pytest.mark.usefixtures("require_database")]
 
-def test_registration():
-    """Test user registration."""
-    print("Testing user registration...")
-    
+def test_registration(client):
+    """Test user registration with a fresh user."""
+    username = f"testuser_{uuid.uuid4().hex[:8]}"
     data = {
-        "username": "testuser",
-        "email": "test@example.com",
+        "username": username,
+        "email": f"{username}@example.com",
         "password": "testpassword123",
         "full_name": "Test User"
     }
     
-    try:
-        response = requests.post(f"{BASE_URL}/auth/register", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        print(f"Error: {e}")
-        return None
+    response = client.post("/auth/register", json=data)
+    assert response.status_code == 200
+    assert response.json()["username"] == username
 
-def test_login():
-    """Test user login."""
-    print("\nTesting user login...")
-    
+def test_registration_duplicate_username(client, auth_user):
+    """Test that registering an existing username is rejected."""
     data = {
-        "username": "testuser",
+        "username": auth_user["username"],
+        "email": f"other_{auth_user['username']}@example.com",
         "password": "testpassword123"
     }
     
-    try:
-        response = requests.post(f"{BASE_URL}/auth/login", json=data)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        return response.json() if response.status_code == 200 else None
-    except Exception as e:
-        print(f"Error: {e}")
-        return None
+    response = client.post("/auth/register", json=data)
+    assert response.status_code == 400
 
-def test_me_endpoint(token):
-    """Test getting current user info."""
-    print("\nTesting /auth/me endpoint...")
-    
-    headers = {
-        "Authorization": f"Bearer {token}"
+@pytest.mark.asyncio(loop_scope="session")
+async def test_login_and_get_me(async_client, auth_user):
+    """Test user login and getting current user info, issued concurrently."""
+    data = {
+        "username": auth_user["username"],
+        "password": auth_user["password"]
     }
-    
-    try:
-        response = requests.get(f"{BASE_URL}/auth/me", headers=headers)
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-    except Exception as e:
-        print(f"Error: {e}")
 
-if __name__ == "__main__":
-    print("Authentication System Test")
-    print("=" * 50)
-    
-    # Start the server first with: python stackscout_web.py
-    
-    # Test registration
-    user = test_registration()
-    
-    # Test login
-    login_response = test_login()
-    
-    if login_response and "access_token" in login_response:
-        token = login_response["access_token"]
-        test_me_endpoint(token)
-    
-    print("\n" + "=" * 50)
-    print("Test completed!")
+    login_response, me_response = await asyncio.gather(
+        async_client.post("/auth/login", json=data),
+        async_client.get("/auth/me", headers=auth_user["headers"]),
+    )
+    assert login_response.status_code == 200
+    assert "access_token" in login_response.json()
+    assert me_response.status_code == 200
+    assert me_response.json()["username"] == auth_user["username"]
@@ -1,51 +1,41 @@
 #!/usr/bin/env python3
 """
-Test script for enhanced search filters functionality
+Tests for enhanced search filters functionality
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from job_search_storage import JobSearchStorage, DB_CONFIG
+import pytest
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-def test_enhanced_filters():
+# The storage swallows database errors and returns [], so only run against a live database
+pytestmark = pytest.mark.usefixtures("require_database")
+
+@pytest.mark.parametrize("job_type,salary_range,description", [
+    ("full-time", "", "job type filtering"),
+    ("", "$50k-$70k", "salary range filtering"),
+    ("full-time", "$70k-$90k", "combined filtering"),
+    ("", "$150k+", "minimum salary filtering"),
+])
+def test_enhanced_filters(storage, job_type, salary_range, description):
     """Test the enhanced filtering functionality"""
-    try:
-        storage = JobSearchStorage(DB_CONFIG)
-        print("✅ Connected to database successfully")
-        
-        # Test job type filtering
-        print("\n🧪 Testing job type filtering...")
-        jobs = storage.get_jobs_filtered(job_type="full-time", limit=5)
-        print(f"Found {len(jobs)} full-time jobs")
-        
-        # Test salary range filtering
-        print("\n🧪 Testing salary range filtering...")
-        jobs = storage.get_jobs_filtered(salary_range="$50k-$70k", limit=5)
-        print(f"Found {len(jobs)} jobs in $50k-$70k range")
-        
-        # Test combined filtering
-        print("\n🧪 Testing combined filtering...")
-        jobs = storage.get_jobs_filtered(job_type="full-time", salary_range="$70k-$90k", limit=5)
-        print(f"Found {len(jobs)} full-time jobs in $70k-$90k range")
-        
-        # Test $150k+ filtering
-        print("\n🧪 Testing $150k+ filtering...")
-        jobs = storage.get_jobs_filtered(salary_range="$150k+", limit=5)
-        print(f"Found {len(jobs)} jobs with $150k+ salary")
-        
-        storage.close()
-        print("\n✅ All tests completed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Error during testing: {e}")
-        import traceback
-        traceback.print_exc()
+    jobs = storage.get_jobs_filtered(job_type=job_type, salary_range=salary_range, limit=5)
+    assert isinstance(jobs, list), f"{description} did not return a list"
+    assert len(jobs) <= 5
+
+def test_enhanced_filters_batch(storage, caplog):
+    """Test fetching several salary ranges in one query"""
+    salary_ranges = ["$50k-$70k", "$70k-$90k", "$150k+", "invalid"]
+    with caplog.at_level(logging.WARNING):
+        results = storage.get_jobs_filtered_batch(salary_ranges, limit=5)
+    # Errors are logged and swallowed, so a clean log shows the valid ranges were queried
+    assert [r.getMessage() for r in caplog.records] == ["Invalid salary format: invalid"]
+    assert list(results) == salary_ranges
+    assert results["invalid"] == []
+    for jobs in results.values():
+        assert isinstance(jobs, list)
+        assert len(jobs) <= 5
 
 if __name__ == "__main__":
-    test_enhanced_filters()
+    pytest.main([__file__, "-v"])
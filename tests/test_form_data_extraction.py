@@ -1,15 +1,7 @@
-import sys
-import os
 import pytest
-from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
-from stackscout_web import app
-
-client = TestClient(app)
-
-def test_form_data_extraction_basic():
+def test_form_data_extraction_basic(client):
     """Test basic form data extraction with valid inputs"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -26,7 +18,7 @@ def test_form_data_extraction_basic():
         # Verify that the scraper was called with the correct keywords
         mock_scraper.assert_called_once_with("python developer")
 
-def test_form_data_extraction_default_keywords():
+def test_form_data_extraction_default_keywords(client):
     """Test that default keywords are used when not provided"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -42,7 +34,7 @@ def test_form_data_extraction_default_keywords():
         # Verify that the scraper was called with the default keywords
         mock_scraper.assert_called_once_with("python")
 
-def test_form_data_extraction_empty_keywords():
+def test_form_data_extraction_empty_keywords(client):
     """Test that default keywords are used when empty keywords provided"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -59,7 +51,7 @@ def test_form_data_extraction_empty_keywords():
         # Verify that the scraper was called with the default keywords
         mock_scraper.assert_called_once_with("python")
 
-def test_form_data_extraction_special_characters():
+def test_form_data_extraction_special_characters(client):
     """Test with special characters in keywords"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -76,7 +68,7 @@ def test_form_data_extraction_special_characters():
         # Verify that the scraper was called with the correct keywords
         mock_scraper.assert_called_once_with("python & java")
 
-def test_form_data_extraction_long_strings():
+def test_form_data_extraction_long_strings(client):
     """Test with very long input strings"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -94,7 +86,7 @@ def test_form_data_extraction_long_strings():
         # Verify that the scraper was called with the correct keywords
         mock_scraper.assert_called_once_with(long_string)
 
-def test_form_data_extraction_numeric_values():
+def test_form_data_extraction_numeric_values(client):
     """Test with numeric values in text fields"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -111,7 +103,7 @@ def test_form_data_extraction_numeric_values():
         # Verify that the scraper was called with the correct keywords
         mock_scraper.assert_called_once_with("123")
 
-def test_form_data_extraction_partial_fields():
+def test_form_data_extraction_partial_fields(client):
     """Test with only some fields provided"""
     # Mock the scraper to return sample data
     sample_results = [
@@ -127,7 +119,7 @@ def test_form_data_extraction_partial_fields():
         # Verify that the scraper was called with the correct keywords
         mock_scraper.assert_called_once_with("python")
 
-def test_form_data_extraction_no_data():
+def test_form_data_extraction_no_data(client):
     """Test with no form data provided"""
     # Mock the scraper to return sample data
     sample_results = [
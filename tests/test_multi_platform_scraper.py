@@ -1,9 +1,6 @@
-import os
-import sys
 import pytest
-from unittest.mock import patch, MagicMock
+from dataclasses import dataclass
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import multi_platform_scraper as scraper
 
 @pytest.fixture(autouse=True)
@@ -11,55 +8,36 @@ def set_env_vars(monkeypatch):
     monkeypatch.setenv("LINKEDIN_EMAIL", "test@example.com")
     monkeypatch.setenv("LINKEDIN_PASSWORD", "password123")
 
-from unittest.mock import patch
-
-def test_scrape_remoteok_success(monkeypatch):
-    class MockResponse:
-        def __init__(self, status_code=200, text=""):
-            self.status_code = status_code
-            self.text = text
-        def raise_for_status(self):
-            if self.status_code != 200:
-                raise Exception("HTTP error")
-    def mock_get(*args, **kwargs):
-        html = """
-        <table>
-            <tr class="job" data-position="Dev" data-company="CompanyA" data-href="/job1">
-                <div class="tag">Python</div>
-                <div class="tag">Django</div>
-            </tr>
-            <tr class="job" data-position="Engineer" data-company="CompanyB" data-href="/job2">
-                <div class="tag">JavaScript</div>
-                <div class="tag">React</div>
-            </tr>
-        </table>
-        """
-        return MockResponse(200, html)
-    monkeypatch.setattr(scraper.requests, "get", mock_get)
+@dataclass
+class MockResponse:
+    status_code: int
+    text: str = ""
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise Exception("HTTP error")
+
+def test_scrape_remoteok_success(monkeypatch, remoteok_table_html):
+    monkeypatch.setattr(scraper.requests, "get", lambda *args, **kwargs: MockResponse(200, remoteok_table_html))
     jobs = scraper.scrape_remoteok()
     assert len(jobs) == 2
     assert jobs[0]["Company"] == "CompanyA"
     assert "Python" in jobs[0]["Tech Stack"]
 
-def test_scrape_remoteok_429(monkeypatch, capsys):
-    call_count = {"count": 0}
-    def mock_get(*args, **kwargs):
-        call_count["count"] += 1
-        if call_count["count"] < 3:
-            return type("Resp", (), {"status_code": 429, "raise_for_status": lambda self=None: None, "text": ""})()
-        else:
-            return type("Resp", (), {"status_code": 200, "raise_for_status": lambda self=None: None, "text": """
-            <table>
-                <tr class="job" data-position="Dev" data-company="CompanyA" data-href="/job1">
-                    <div class="tag">Python</div>
-                </tr>
-            </table>
-            """})()
-    monkeypatch.setattr(scraper.requests, "get", mock_get)
+@pytest.mark.parametrize("body", ["", "  \n\t "])
+def test_scrape_remoteok_empty_body(monkeypatch, body):
+    monkeypatch.setattr(scraper.requests, "get", lambda *args, **kwargs: MockResponse(200, body))
+    assert scraper.scrape_remoteok() == []
+
+def test_scrape_remoteok_429(monkeypatch, capsys, remoteok_table_html):
+    responses = iter([MockResponse(429), MockResponse(429), MockResponse(200, remoteok_table_html)])
+    monkeypatch.setattr(scraper.requests, "get", lambda *args, **kwargs: next(responses))
+    # Skip the exponential backoff between retries
+    monkeypatch.setattr(scraper.time, "sleep", lambda x: None)
     jobs = scraper.scrape_remoteok()
     captured = capsys.readouterr()
     assert "Received 429 Too Many Requests" in captured.out
-    assert len(jobs) == 1
+    assert len(jobs) == 2
 
 def test_scrape_indeed_no_driver():
     jobs = scraper.scrape_indeed(None)
@@ -94,3 +72,45 @@ def test_scrape_arc_dev_placeholder(capsys):
     captured = capsys.readouterr()
     assert "No Selenium driver available" in captured.out
     assert result == []
+
+def _arc_dev_card(i):
+    return f"""
+    <a class="job-card featured" href="/jobs/{i}">
+        <div class="card-body">
+            <h3 class="job-title"><span>Engineer</span> {i}</h3>
+            <div class="company-name">Company {i}</div>
+            <div class="job-location"><span class="flag">Remote</span> - Zone {i}</div>
+        </div>
+    </a>
+    <a class="company-link" href="/companies/{i}">Company {i}</a>"""
+
+class _NoWait:
+    """WebDriverWait stand-in; the mock driver has no elements to poll for."""
+    def __init__(self, driver, timeout):
+        pass
+    def until(self, condition):
+        return True
+
+def test_scrape_arc_dev_top_five(monkeypatch, mock_selenium_driver):
+    cards = "".join(_arc_dev_card(i) for i in range(1, 8))
+    mock_selenium_driver.page_source = f"""
+    <html><body>
+        <nav><a href="/jobs">Jobs</a><a class="job-cardish" href="/x">Not a card</a></nav>
+        <section>{cards}</section>
+    </body></html>"""
+    monkeypatch.setattr(scraper, "WebDriverWait", _NoWait)
+
+    jobs = scraper.scrape_arc_dev(mock_selenium_driver)
+
+    assert [job["Link"] for job in jobs] == [f"/jobs/{i}" for i in range(1, 6)]
+    assert jobs[0] == {
+        "Company": "Company 1",
+        "Role": "Engineer 1",
+        "Tech Stack": "N/A",
+        "Type": "Remote - Zone 1",
+        "Salary": "N/A",
+        "Contact Person": "N/A",
+        "Email": "N/A",
+        "Link": "/jobs/1"
+    }
+    assert [job["Company"] for job in jobs] == [f"Company {i}" for i in range(1, 6)]
@@ -4,166 +4,110 @@ Test suite for salary filtering functionality including million suffix support
 """
 
 import pytest
-import sys
-import os
-
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)) + '/..')
-
 from job_search_storage import JobSearchStorage
 
+@pytest.fixture(scope="module")
+def parser():
+    """Storage instance built without __init__: parsing only, no database connection"""
+    return JobSearchStorage.__new__(JobSearchStorage)
+
 class TestSalaryFiltering:
     """Test class for salary filtering functionality"""
     
-    def setup_method(self):
-        """Set up test environment"""
-        # Use a mock DB config since we're only testing parsing functionality
-        self.storage = JobSearchStorage({
-            'host': 'localhost',
-            'database': 'test_db',
-            'user': 'test_user',
-            'password': 'test_pass',
-            'port': 5432
-        })
-    
-    def test_million_suffix_parsing(self):
+    @pytest.mark.parametrize("input_str,expected", [
+        ("1m", 1000000),
+        ("1M", 1000000),
+        ("1.5m", 1500000),
+        ("2.5M", 2500000),
+        ("10m", 10000000),
+        ("0m", 0),
+        ("0.1m", 100000),
+    ])
+    def test_million_suffix_parsing(self, parser, input_str, expected):
         """Test parsing of million suffixes"""
-        test_cases = [
-            ("1m", 1000000),
-            ("1M", 1000000),
-            ("1.5m", 1500000),
-            ("2.5M", 2500000),
-            ("10m", 10000000),
-            ("0m", 0),
-            ("0.1m", 100000),
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.storage.parse_salary_amount(input_str)
-            assert result == expected, f"Failed for {input_str}: got {result}, expected {expected}"
+        assert parser.parse_salary_amount(input_str) == expected
     
-    def test_normalization_functionality(self):
+    @pytest.mark.parametrize("input_str,expected", [
+        (" 100 ", 100),
+        ("100+", 100),
+        (" 1k ", 1000),
+        ("1k+", 1000),
+        (" 1m ", 1000000),
+        ("1m+", 1000000),
+        (" $100 ", 100),
+        ("€1k+", 1000),
+        (" £1m ", 1000000),
+    ])
+    def test_normalization_functionality(self, parser, input_str, expected):
         """Test input normalization (whitespace stripping and plus sign removal)"""
-        test_cases = [
-            (" 100 ", 100),
-            ("100+", 100),
-            (" 1k ", 1000),
-            ("1k+", 1000),
-            (" 1m ", 1000000),
-            ("1m+", 1000000),
-            (" $100 ", 100),
-            ("€1k+", 1000),
-            (" £1m ", 1000000),
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.storage.parse_salary_amount(input_str)
-            assert result == expected, f"Failed for '{input_str}': got {result}, expected {expected}"
+        assert parser.parse_salary_amount(input_str) == expected
     
-    def test_backward_compatibility(self):
+    @pytest.mark.parametrize("input_str,expected", [
+        ("100", 100),
+        ("1k", 1000),
+        ("1K", 1000),
+        ("10k", 10000),
+        ("100k", 100000),
+        ("$100", 100),
+        ("€1k", 1000),
+        ("£100", 100),
+        ("1,000", 1000),
+        ("10,000", 10000),
+    ])
+    def test_backward_compatibility(self, parser, input_str, expected):
         """Test that existing functionality still works"""
-        test_cases = [
-            ("100", 100),
-            ("1k", 1000),
-            ("1K", 1000),
-            ("10k", 10000),
-            ("100k", 100000),
-            ("$100", 100),
-            ("€1k", 1000),
-            ("£100", 100),
-            ("1,000", 1000),
-            ("10,000", 10000),
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.storage.parse_salary_amount(input_str)
-            assert result == expected, f"Failed for {input_str}: got {result}, expected {expected}"
+        assert parser.parse_salary_amount(input_str) == expected
     
-    def test_salary_range_parsing(self):
+    @pytest.mark.parametrize("input_str,expected", [
+        ("1m-2m", (1000000, 2000000)),
+        ("500k-1m", (500000, 1000000)),
+        ("1.5m-2.5m", (1500000, 2500000)),
+        ("1m+", (1000000, None)),
+        ("500k+", (500000, None)),
+    ])
+    def test_salary_range_parsing(self, parser, input_str, expected):
         """Test salary range parsing with million suffixes"""
-        test_cases = [
-            ("1m-2m", (1000000, 2000000)),
-            ("500k-1m", (500000, 1000000)),
-            ("1.5m-2.5m", (1500000, 2500000)),
-            ("1m+", (1000000, None)),
-            ("500k+", (500000, None)),
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.storage.parse_salary_range_for_query(input_str)
-            assert result == expected, f"Failed for {input_str}: got {result}, expected {expected}"
+        assert parser.parse_salary_range_for_query(input_str) == expected
     
-    def test_error_handling(self):
+    @pytest.mark.parametrize("invalid_input", [
+        None,
+        "",
+        " ",
+        "invalid",
+        "1x",  # Unknown suffix
+        "abc123",
+    ])
+    def test_error_handling(self, parser, invalid_input):
         """Test error cases"""
-        invalid_cases = [
-            None,
-            "",
-            " ",
-            "invalid",
-            "1x",  # Unknown suffix
-            "abc123",
-        ]
-        
-        for invalid_input in invalid_cases:
-            with pytest.raises(ValueError):
-                self.storage.parse_salary_amount(invalid_input)
+        with pytest.raises(ValueError):
+            parser.parse_salary_amount(invalid_input)
     
-    def test_mixed_suffix_ranges(self):
+    @pytest.mark.parametrize("input_str,expected", [
+        ("500k-1m", (500000, 1000000)),
+        ("1m-1500k", (1000000, 1500000)),
+        ("800k-1.2m", (800000, 1200000)),
+    ])
+    def test_mixed_suffix_ranges(self, parser, input_str, expected):
         """Test ranges with mixed suffixes (k and m)"""
-        test_cases = [
-            ("500k-1m", (500000, 1000000)),
-            ("1m-1500k", (1000000, 1500000)),
-            ("800k-1.2m", (800000, 1200000)),
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.storage.parse_salary_range_for_query(input_str)
-            assert result == expected, f"Failed for {input_str}: got {result}, expected {expected}"
+        assert parser.parse_salary_range_for_query(input_str) == expected
     
-    def test_currency_with_million_suffix(self):
+    @pytest.mark.parametrize("input_str,expected", [
+        ("$1m", 1000000),
+        ("€1.5m", 1500000),
+        ("£2m", 2000000),
+        ("$1m+", 1000000),
+        ("€1.5m+", 1500000),
+    ])
+    def test_currency_with_million_suffix(self, parser, input_str, expected):
         """Test currency symbols with million suffixes"""
-        test_cases = [
-            ("$1m", 1000000),
-            ("€1.5m", 1500000),
-            ("£2m", 2000000),
-            ("$1m+", 1000000),
-            ("€1.5m+", 1500000),
-        ]
-        
-        for input_str, expected in test_cases:
-            result = self.storage.parse_salary_amount(input_str)
-            assert result == expected, f"Failed for {input_str}: got {result}, expected {expected}"
+        assert parser.parse_salary_amount(input_str) == expected
+
+    def test_bulk_salary_parsing(self, parser):
+        """Test bulk parsing matches per-item parsing for storage"""
+        salary_texts = ["$100k-$150k", "N/A", "€80k+", "$100k-$150k", ""]
+        results = parser.parse_salaries_bulk(salary_texts)
+        assert results == [parser.parse_salary_for_storage(text) for text in salary_texts]
+        assert results[0] == (100000, 150000, 'USD')
 
 if __name__ == "__main__":
-    # Run the tests directly
-    test_instance = TestSalaryFiltering()
-    test_instance.setup_method()
-    
-    print("Running salary filtering tests...")
-    print("=" * 50)
-    
-    # Run each test method
-    test_methods = [
-        test_instance.test_million_suffix_parsing,
-        test_instance.test_normalization_functionality,
-        test_instance.test_backward_compatibility,
-        test_instance.test_salary_range_parsing,
-        test_instance.test_error_handling,
-        test_instance.test_mixed_suffix_ranges,
-        test_instance.test_currency_with_million_suffix,
-    ]
-    
-    all_passed = True
-    for method in test_methods:
-        try:
-            method()
-            print(f"✓ {method.__name__}")
-        except Exception as e:
-            print(f"✗ {method.__name__}: {e}")
-            all_passed = False
-    
-    print("=" * 50)
-    if all_passed:
-        print("All tests passed! ✅")
-    else:
-        print("Some tests failed! ❌")
+    pytest.main([__file__, "-v"])
@@ -1,11 +1,16 @@
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import multi_platform_scraper_playwright as scraper
 
+_ARKDEV_HTML = """
+<div class="job-card">
+    <h3 class="job-title">Python Developer</h3>
+    <div class="company-name">Test Company</div>
+    <a href="/jobs/123"></a>
+</div>
+"""
+
 @pytest.mark.asyncio
 async def test_scrape_arkdev_function_signature():
     """Test that scrape_arkdev accepts both context and keywords parameters"""
@@ -16,7 +21,7 @@ async def test_scrape_arkdev_function_signature():
     mock_context = AsyncMock()
     mock_page = AsyncMock()
     mock_context.new_page.return_value = mock_page
-    mock_page.content.return_value = "<div>No jobs found</div>"
+    mock_page.content.return_value = _ARKDEV_HTML
     mock_page.close = AsyncMock()
     mock_page.wait_for_selector = AsyncMock()
     
@@ -41,14 +46,7 @@ async def test_scrape_arkdev_with_keywords():
     mock_context = AsyncMock()
     mock_page = AsyncMock()
     mock_context.new_page.return_value = mock_page
-    html_content = """
-    <div class="job-card">
-        <h3 class="job-title">Python Developer</h3>
-        <div class="company-name">Test Company</div>
-        <a href="/jobs/123"></a>
-    </div>
-    """
-    mock_page.content.return_value = html_content
+    mock_page.content.return_value = _ARKDEV_HTML
     mock_page.close = AsyncMock()
     mock_page.wait_for_selector = AsyncMock()
     
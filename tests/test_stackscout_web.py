@@ -1,29 +1,23 @@
-import sys
-import os
 import pytest
-from fastapi.testclient import TestClient
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from stackscout_web import app
+import stackscout_web
 
-client = TestClient(app)
-
-def test_read_form():
+def test_read_form(client):
     response = client.get("/")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
     assert "<form" in response.text or "Job Search" in response.text
 
-def test_run_job_search_success(monkeypatch):
+def test_run_job_search_success(client, monkeypatch):
     # Mock run_scraper to return sample data
     sample_results = [
         {"Company": "TestCo", "Role": "Developer", "Link": "http://example.com", "Tech Stack": "Python", "Type": "Remote", "Salary": "N/A", "Contact Person": "N/A", "Email": "N/A"}
     ]
     def mock_run_scraper(email, password):
         return sample_results
-    monkeypatch.setattr("stackscout_web.run_scraper", mock_run_scraper)
-    os.environ["LINKEDIN_EMAIL"] = "test@example.com"
-    os.environ["LINKEDIN_PASSWORD"] = "password123"
+    monkeypatch.setattr(stackscout_web, "run_scraper", mock_run_scraper)
+    monkeypatch.setenv("LINKEDIN_EMAIL", "test@example.com")
+    monkeypatch.setenv("LINKEDIN_PASSWORD", "password123")
     response = client.post("/run")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
@@ -31,11 +25,25 @@ def test_run_job_search_success(monkeypatch):
     assert "Developer" in response.text
     assert "TestCo" in response.text
 
-def test_run_job_search_failure(monkeypatch):
+def test_run_job_search_failure(client, monkeypatch):
     def mock_run_scraper(email, password):
         raise Exception("Scraper error")
-    monkeypatch.setattr("stackscout_web.run_scraper", mock_run_scraper)
+    monkeypatch.setattr(stackscout_web, "run_scraper", mock_run_scraper)
     response = client.post("/run")
     assert response.status_code == 200
     # The error message is logged but the template shows "No job results found."
     assert "No job results found" in response.text or "Job search failed" in response.text
+
+def test_results_template_escapes_once():
+    job = {"Company": "Tom & Jerry", "Role": "<script>alert(1)</script>", "Link": "http://example.com/?a=1&b=2",
+           "Tech Stack": "Python", "Type": "Remote", "Salary": "N/A", "Contact Person": "N/A", "Email": "N/A"}
+    # Render with the app's own autoescaping environment, as /run does
+    template = stackscout_web.templates.get_template("results.html")
+    html = template.render(results=stackscout_web.escape_results_for_template([job]))
+    assert "<script>alert(1)</script>" not in html
+    assert html.count("&lt;script&gt;alert(1)&lt;/script&gt;") == 1
+    assert "Tom &amp; Jerry" in html
+    assert 'href="http://example.com/?a=1&amp;b=2"' in html
+    # Pre-escaped Markup must not be escaped again by the template
+    assert "&amp;lt;" not in html
+    assert "&amp;amp;" not in html
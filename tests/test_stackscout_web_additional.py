@@ -1,19 +1,9 @@
-import sys
-import os
-import pytest
-from unittest.mock import MagicMock, patch
-
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import patch
 
 import stackscout_web
 from selenium.common.exceptions import TimeoutException
 
-@pytest.fixture
-def mock_driver():
-    driver = MagicMock()
-    return driver
-
-def test_google_jobs_scraping_retries(mock_driver):
+def test_google_jobs_scraping_retries(mock_selenium_driver):
     # Patch WebDriverWait to raise TimeoutException twice then succeed
     wait_calls = []
 
@@ -27,8 +17,8 @@ def test_google_jobs_scraping_retries(mock_driver):
             return True
 
     with patch('stackscout_web.WebDriverWait', MockWait), \
-         patch('stackscout_web.get_driver', return_value=mock_driver):
-        mock_driver.page_source = '''
+         patch('stackscout_web.get_driver', return_value=mock_selenium_driver):
+        mock_selenium_driver.page_source = '''
         <div jscontroller="test">
             <div role="heading">Test Job</div>
             <a href="http://example.com/job1">Link</a>
@@ -40,45 +30,45 @@ def test_google_jobs_scraping_retries(mock_driver):
         assert len(google_jobs) > 0
         assert google_jobs[0]["Role"] == "Test Job"
 
-def test_linkedin_login_retry_success(mock_driver):
+def test_linkedin_login_retry_success(mock_selenium_driver):
     # This test is replaced by direct testing of login_linkedin retry logic
     pass
 
-def test_login_linkedin_retry_logic():
-    driver = MagicMock()
-    call_count = {"count": 0}
-
-    def side_effect_get(url):
-        call_count["count"] += 1
-        return None
-
-    driver.get = side_effect_get
-    driver.find_element.return_value = MagicMock()
-
-    # Change current_url dynamically based on call_count
-    def current_url_side_effect(self):
-        if call_count["count"] < 3:
+class FakeElement:
+    """Form field or button stand-in that accepts input and clicks."""
+    def send_keys(self, *keys):
+        pass
+    def clear(self):
+        pass
+    def click(self):
+        pass
+
+class FakeDriver:
+    """Driver that shows the login page and a captcha until its third page load."""
+    def __init__(self):
+        self._calls = 0
+    def get(self, url):
+        self._calls += 1
+    def find_element(self, by, value):
+        return FakeElement()
+    def find_elements(self, by, value):
+        # Simulate captcha detection on first two attempts, success on third
+        return [FakeElement()] if self._calls < 3 else []
+    @property
+    def current_url(self):
+        if self._calls < 3:
             return "https://www.linkedin.com/login"
-        else:
-            return "https://www.linkedin.com/feed"
-
-    type(driver).current_url = property(current_url_side_effect)
+        return "https://www.linkedin.com/feed"
 
-    # Simulate captcha detection on first two attempts, success on third
-    def side_effect_find_elements(by, value):
-        if call_count["count"] < 3:
-            return [MagicMock()]  # captcha detected
-        else:
-            return []
-
-    driver.find_elements.side_effect = side_effect_find_elements
+def test_login_linkedin_retry_logic():
+    driver = FakeDriver()
 
     with patch('time.sleep', return_value=None):
         result = stackscout_web.login_linkedin(driver, "email", "password")
         assert result is True
-        assert call_count["count"] == 3
+        assert driver._calls == 3
 
-def test_indeed_scraping_error_handling(mock_driver):
+def test_indeed_scraping_error_handling(mock_selenium_driver):
     # Patch WebDriverWait.until to raise TimeoutException to simulate slow page load
     class MockWait:
         def __init__(self, driver, timeout):
@@ -87,7 +77,7 @@ def test_indeed_scraping_error_handling(mock_driver):
             raise TimeoutException("Timeout")
 
     with patch('stackscout_web.WebDriverWait', MockWait):
-        mock_driver.page_source = '''
+        mock_selenium_driver.page_source = '''
         <div class="job_seen_beacon">
             <h2>Test Job</h2>
             <span class="companyName">Test Company</span>
@@ -95,5 +85,5 @@ def test_indeed_scraping_error_handling(mock_driver):
         </div>
         '''
         # The scrape_indeed function should return empty list on timeout
-        jobs = stackscout_web.scrape_indeed(mock_driver)
+        jobs = stackscout_web.scrape_indeed(mock_selenium_driver)
         assert jobs == []
@@ -5,29 +5,6 @@ class TestSalaryFilterValidationNoDB(unittest.TestCase):
     def setUp(self):
         # Create a minimal storage instance without database connection
         self.storage = JobSearchStorage.__new__(JobSearchStorage)
-        
-        # Mock the parse_salary_amount method
-        def parse_salary_amount(amount_str):
-            """Parse a single salary amount string and return numeric value"""
-            if not amount_str:
-                return None
-            
-            # Remove currency symbols and commas
-            clean_str = amount_str.replace('$', '').replace('€', '').replace('£', '').replace(',', '')
-            
-            # Handle 'k' suffix (thousands)
-            if clean_str.lower().endswith('k'):
-                clean_str = clean_str[:-1]
-                multiplier = 1000
-            else:
-                multiplier = 1
-            
-            try:
-                return int(float(clean_str) * multiplier)
-            except (ValueError, TypeError):
-                raise ValueError(f"Invalid salary amount: {amount_str}")
-        
-        self.storage.parse_salary_amount = parse_salary_amount
 
     def test_empty_salary_filter(self):
         with self.assertRaises(ValueError) as context: